@@ -53,6 +53,15 @@ class ASTNode:
         """
         self._children.append(child)
 
+    def add_children(self, children):
+        """
+        Add several child nodes at once, in order.
+
+        Args:
+            children (Iterable[ASTNode]): The child nodes to add.
+        """
+        self._children.extend(children)
+
     @property
     def children(self):
         """
@@ -606,14 +615,37 @@ class Table(ASTNode):
     Represents a table node.
     """
 
-    def __init__(self, children=None):
+    def __init__(self, children=None, columns=None):
         """
         Initialize a Table node.
 
         Args:
             children (list, optional): Child nodes. Defaults to None. Represents table rows.
+            columns (int, optional): Number of columns, if known when the table is built.
+                Defaults to None.
+        """
+        attributes = {"columns": columns} if columns is not None else None
+        super().__init__("table", children, attributes=attributes)
+
+    @property
+    def columns(self):
+        """
+        int: The number of columns, counted from the widest row if not set.
+        """
+        columns = self.attributes.get("columns")
+        if columns is None:
+            columns = max((len(row.children) for row in self.children), default=0)
+        return columns
+
+    @columns.setter
+    def columns(self, value):
+        """
+        Set the number of columns.
+
+        Args:
+            value (int): The new number of columns.
         """
-        super().__init__("table", children)
+        self.set_attribute("columns", value)
 
     def convert(self, converter: "BaseConverter") -> str:
         return converter.convert_table(self)
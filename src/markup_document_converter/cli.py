@@ -8,7 +8,10 @@ from markup_document_converter.registry import (
     get_available_parsers,
     get_available_converters,
 )
-from markup_document_converter.core import convert_document
+from markup_document_converter.core import (
+    convert_document,
+    convert_document_to_file,
+)
 
 from waitress import serve
 from markup_document_converter.webapp import app as flask_app
@@ -130,15 +133,19 @@ def convert(
         content += "\n"
 
     try:
-        result = convert_document(
-            content=content,
-            source_format=source_format,
-            target_format=to.lower(),
-        )
-
         if output:
-            output.write_text(result, encoding="utf-8")
+            convert_document_to_file(
+                content=content,
+                source_format=source_format,
+                target_format=to.lower(),
+                path=output,
+            )
         else:
+            result = convert_document(
+                content=content,
+                source_format=source_format,
+                target_format=to.lower(),
+            )
             typer.echo(result)
 
     except ValueError as e:
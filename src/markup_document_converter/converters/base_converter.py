@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+
 import markup_document_converter.ast_tree as ast_tree
 
 
@@ -12,8 +13,141 @@ class BaseConverter(ABC):
 
     The Visitor pattern allows adding new operations (converters) to the AST nodes
     without modifying the node classes themselves.
+
+    Converters may also define streaming emitters named `_emit_<name>`, after
+    the `convert_<name>` method of the same node type. A node whose type has an
+    emitter appends its output straight into the output parts of its parent, so
+    nested output is joined only once.
     """
 
+    # Suffix of the `convert_*` and `_emit_*` methods handling each node type
+    node_method_names = {
+        ast_tree.ASTNode: "default",
+        ast_tree.Document: "document",
+        ast_tree.Heading: "heading",
+        ast_tree.Bold: "bold",
+        ast_tree.Italic: "italic",
+        ast_tree.Strike: "strike",
+        ast_tree.Text: "text",
+        ast_tree.Paragraph: "paragraph",
+        ast_tree.LineBreak: "line_break",
+        ast_tree.Blockquote: "blockquote",
+        ast_tree.List: "list",
+        ast_tree.ListItem: "list_item",
+        ast_tree.TaskListItem: "task_list_item",
+        ast_tree.CodeBlock: "code_block",
+        ast_tree.InlineCode: "inline_code",
+        ast_tree.Image: "image",
+        ast_tree.Link: "link",
+        ast_tree.HorizontalRule: "horizontal_rule",
+        ast_tree.Table: "table",
+        ast_tree.TableRow: "table_row",
+        ast_tree.TableCell: "table_cell",
+    }
+
+    def __init__(self):
+        """
+        Initialize the converter with its dispatch tables.
+
+        `_converters` maps each node type straight to its `convert_*` method,
+        skipping the round trip through `ASTNode.convert`. `_emitters` maps node
+        types to their `_emit_*` methods, leaving out emitters whose `convert_*`
+        method is overridden by a subclass, so that the override is honoured.
+        """
+        self._converters = {}
+        self._emitters = {}
+        for node_type, name in self.node_method_names.items():
+            self._converters[node_type] = getattr(self, f"convert_{name}")
+            if self._uses_emitter(name):
+                self._emitters[node_type] = getattr(self, f"_emit_{name}")
+
+    @classmethod
+    def _uses_emitter(cls, name):
+        """
+        Check whether nodes handled by `convert_<name>` can use `_emit_<name>`.
+
+        Args:
+            name (str): Suffix of the node type's methods.
+
+        Returns:
+            bool: True if the emitter exists and is defined in the same class as
+                the `convert_*` method or in a subclass of it.
+        """
+        emitter_owner = next(
+            (klass for klass in cls.__mro__ if f"_emit_{name}" in vars(klass)), None
+        )
+        if emitter_owner is None:
+            return False
+        converter_owner = next(
+            klass for klass in cls.__mro__ if f"convert_{name}" in vars(klass)
+        )
+        return issubclass(emitter_owner, converter_owner)
+
+    def _emit(self, node, parts):
+        """
+        Append the representation of a node to the output parts.
+
+        Args:
+            node (ast_tree.ASTNode): The AST node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        node_type = type(node)
+        emitter = self._emitters.get(node_type)
+        if emitter is not None:
+            emitter(node, parts)
+            return
+
+        # Subclasses of the known node types may override `convert`
+        convert = self._converters.get(node_type)
+        if convert is None:
+            parts.append(node.convert(self))
+        else:
+            parts.append(convert(node))
+
+    def _emit_markup(self, left, right, node, parts):
+        """
+        Helper method to wrap node children with markup delimiters.
+
+        Args:
+            left (str): Left delimiter/markup to add before content.
+            right (str): Right delimiter/markup to add after content.
+            node (ast_tree.ASTNode): The AST node whose children to process.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        parts.append(left)
+        for child in node.children:
+            self._emit(child, parts)
+        parts.append(right)
+
+    def _render(self, emitter, node):
+        """
+        Run an emitter on a node and join its output.
+
+        Args:
+            emitter (Callable): The `_emit_*` method for the node type.
+            node (ast_tree.ASTNode): The AST node to convert.
+
+        Returns:
+            str: The joined representation of the node.
+        """
+        parts = []
+        emitter(node, parts)
+        return "".join(parts)
+
+    def convert_document_parts(self, document: ast_tree.Document) -> list[str]:
+        """
+        Convert a document node into its output fragments without a final join.
+
+        Args:
+            document (ast_tree.Document): The document node to convert.
+
+        Returns:
+            list[str]: Output fragments that concatenate to `convert_document`.
+        """
+        parts = []
+        self._emit(document, parts)
+        return parts
+
     @abstractmethod
     def convert_default(self, node: ast_tree.ASTNode) -> str:
         """
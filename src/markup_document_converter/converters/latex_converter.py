@@ -34,8 +34,17 @@ class LatexConverter(BaseConverter):
         Returns:
             str: Full LaTeX document as a string.
         """
-        body = "".join(child.convert(self) for child in document.children)
-        return (
+        return self._render(self._emit_document, document)
+
+    def _emit_document(self, document: ast.Document, parts: list[str]) -> None:
+        """
+        Convert the root document node to LaTeX.
+
+        Args:
+            document (Document): The root document node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup(
             "\\documentclass{article}\n"
             "\\usepackage[utf8]{inputenc}\n"
             "\\usepackage[T1]{fontenc}\n"
@@ -45,9 +54,10 @@ class LatexConverter(BaseConverter):
             "\\usepackage{listings}\n"
             "\\usepackage{booktabs}\n"
             "\\usepackage{xcolor}\n"
-            "\\begin{document}\n"
-            f"{body}\n"
-            "\\end{document}\n"
+            "\\begin{document}\n",
+            "\n\\end{document}\n",
+            document,
+            parts,
         )
 
     def convert_heading(self, heading: ast.Heading) -> str:
@@ -60,10 +70,19 @@ class LatexConverter(BaseConverter):
         Returns:
             str: Corresponding LaTeX section/subsection/etc.
         """
+        return self._render(self._emit_heading, heading)
+
+    def _emit_heading(self, heading: ast.Heading, parts: list[str]) -> None:
+        """
+        Convert a heading node to a LaTeX section command.
+
+        Args:
+            heading (Heading): The heading node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
         level_map = {1: "section", 2: "subsection", 3: "subsubsection"}
         cmd = level_map.get(heading.level, "paragraph")
-        title = "".join(child.convert(self) for child in heading.children)
-        return f"\\{cmd}{{{title}}}\n\n"
+        self._emit_markup(f"\\{cmd}{{", "}\n\n", heading, parts)
 
     def convert_paragraph(self, paragraph: ast.Paragraph) -> str:
         """
@@ -75,8 +94,17 @@ class LatexConverter(BaseConverter):
         Returns:
             str: Paragraph text followed by a newline.
         """
-        text = "".join(child.convert(self) for child in paragraph.children)
-        return f"{text}\n\n"
+        return self._render(self._emit_paragraph, paragraph)
+
+    def _emit_paragraph(self, paragraph: ast.Paragraph, parts: list[str]) -> None:
+        """
+        Convert a paragraph node to LaTeX.
+
+        Args:
+            paragraph (Paragraph): The paragraph node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("", "\n\n", paragraph, parts)
 
     def convert_text(self, text: ast.Text) -> str:
         """
@@ -112,8 +140,17 @@ class LatexConverter(BaseConverter):
         Returns:
             str: \textbf wrapped content.
         """
-        content = "".join(child.convert(self) for child in bold.children)
-        return f"\\textbf{{{content}}}"
+        return self._render(self._emit_bold, bold)
+
+    def _emit_bold(self, bold: ast.Bold, parts: list[str]) -> None:
+        """
+        Convert bold formatting to LaTeX.
+
+        Args:
+            bold (Bold): Bold node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("\\textbf{", "}", bold, parts)
 
     def convert_italic(self, italic: ast.Italic) -> str:
         """
@@ -125,8 +162,17 @@ class LatexConverter(BaseConverter):
         Returns:
             str: \textit wrapped content.
         """
-        content = "".join(child.convert(self) for child in italic.children)
-        return f"\\textit{{{content}}}"
+        return self._render(self._emit_italic, italic)
+
+    def _emit_italic(self, italic: ast.Italic, parts: list[str]) -> None:
+        """
+        Convert italic formatting to LaTeX.
+
+        Args:
+            italic (Italic): Italic node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("\\textit{", "}", italic, parts)
 
     def convert_strike(self, strike: ast.Strike) -> str:
         """
@@ -138,8 +184,17 @@ class LatexConverter(BaseConverter):
         Returns:
             str: \\sout wrapped content.
         """
-        content = "".join(child.convert(self) for child in strike.children)
-        return f"\\sout{{{content}}}"
+        return self._render(self._emit_strike, strike)
+
+    def _emit_strike(self, strike: ast.Strike, parts: list[str]) -> None:
+        """
+        Convert strikethrough formatting to LaTeX.
+
+        Args:
+            strike (Strike): Strike node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("\\sout{", "}", strike, parts)
 
     def convert_line_break(self, line_break: ast.LineBreak) -> str:
         """
@@ -163,8 +218,17 @@ class LatexConverter(BaseConverter):
         Returns:
             str: Content wrapped in quote environment.
         """
-        inner = "".join(child.convert(self) for child in blockquote.children)
-        return f"\\begin{{quote}}\n{inner}\\end{{quote}}\n\n"
+        return self._render(self._emit_blockquote, blockquote)
+
+    def _emit_blockquote(self, blockquote: ast.Blockquote, parts: list[str]) -> None:
+        """
+        Convert blockquote to LaTeX quote environment.
+
+        Args:
+            blockquote (Blockquote): Blockquote node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("\\begin{quote}\n", "\\end{quote}\n\n", blockquote, parts)
 
     def convert_list(self, list_node: ast.List) -> str:
         """
@@ -176,9 +240,20 @@ class LatexConverter(BaseConverter):
         Returns:
             str: LaTeX list environment.
         """
+        return self._render(self._emit_list, list_node)
+
+    def _emit_list(self, list_node: ast.List, parts: list[str]) -> None:
+        """
+        Convert a list node to itemize or enumerate.
+
+        Args:
+            list_node (List): List node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
         env = "itemize" if list_node.list_type == "unordered" else "enumerate"
-        items = "".join(child.convert(self) for child in list_node.children)
-        return f"\\begin{{{env}}}\n{items}\\end{{{env}}}\n\n"
+        self._emit_markup(
+            f"\\begin{{{env}}}\n", f"\\end{{{env}}}\n\n", list_node, parts
+        )
 
     def convert_list_item(self, list_item: ast.ListItem) -> str:
         """
@@ -190,8 +265,17 @@ class LatexConverter(BaseConverter):
         Returns:
             str: \\item line.
         """
-        content = "".join(child.convert(self) for child in list_item.children)
-        return f"  \\item {content}\n"
+        return self._render(self._emit_list_item, list_item)
+
+    def _emit_list_item(self, list_item: ast.ListItem, parts: list[str]) -> None:
+        """
+        Convert a list item to LaTeX \\item.
+
+        Args:
+            list_item (ListItem): List item node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("  \\item ", "\n", list_item, parts)
 
     def convert_task_list_item(self, task_list_item: ast.TaskListItem) -> str:
         """
@@ -203,9 +287,20 @@ class LatexConverter(BaseConverter):
         Returns:
             str: \\item with checkbox symbol.
         """
+        return self._render(self._emit_task_list_item, task_list_item)
+
+    def _emit_task_list_item(
+        self, task_list_item: ast.TaskListItem, parts: list[str]
+    ) -> None:
+        """
+        Convert a task list item to LaTeX with checkbox.
+
+        Args:
+            task_list_item (TaskListItem): Task list item node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
         box = r"$\boxtimes$" if task_list_item.checked else r"$\square$"
-        content = "".join(child.convert(self) for child in task_list_item.children)
-        return f"  \\item[{box}] {content}\n"
+        self._emit_markup(f"  \\item[{box}] ", "\n", task_list_item, parts)
 
     def convert_code_block(self, code_block: ast.CodeBlock) -> str:
         """
@@ -312,7 +407,7 @@ class LatexConverter(BaseConverter):
         """
         if not table.children:
             return ""
-        cols = max(len(r.children) for r in table.children)
+        cols = table.columns
         fmt = "|".join(["l"] * cols)
         rows = []
 
@@ -338,4 +433,14 @@ class LatexConverter(BaseConverter):
         Returns:
             str: LaTeX content of the cell.
         """
-        return "".join(child.convert(self) for child in table_cell.children)
+        return self._render(self._emit_table_cell, table_cell)
+
+    def _emit_table_cell(self, table_cell: ast.TableCell, parts: list[str]) -> None:
+        """
+        Convert a table cell node to LaTeX.
+
+        Args:
+            table_cell (TableCell): Table cell node.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("", "", table_cell, parts)
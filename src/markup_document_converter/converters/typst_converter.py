@@ -1,3 +1,5 @@
+import functools
+
 from markup_document_converter.converters.base_converter import BaseConverter
 from markup_document_converter.registry import register_converter
 import markup_document_converter.ast_tree as ast_tree
@@ -17,20 +19,13 @@ class TypstConverter(BaseConverter):
     Typst equivalents.
     """
 
-    def _add_markup(self, left, right, node):
-        """
-        Helper method to wrap node children with markup delimiters.
+    # Characters with special meaning in Typst markup, escaped with a backslash
+    special_chars_table = str.maketrans(
+        {char: f"\\{char}" for char in "\\*#[]+-/$=<>@'\"`"}
+    )
 
-        Args:
-            left (str): Left delimiter/markup to add before content.
-            right (str): Right delimiter/markup to add after content.
-            node (ast_tree.ASTNode): The AST node whose children to process.
-
-        Returns:
-            str: The content wrapped with specified delimiters.
-        """
-        chidren_result = "".join([child.convert(self) for child in node.children])
-        return f"{left}{chidren_result}{right}"
+    # Left markup of headings, indexed by level (Markdown has levels 1 to 6)
+    heading_markers = tuple(f"\n{'=' * level} " for level in range(7))
 
     def convert_default(self, node: ast_tree.ASTNode) -> str:
         """
@@ -54,7 +49,17 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst representation of the document.
         """
-        return self._add_markup("", "\n", document)
+        return self._render(self._emit_document, document)
+
+    def _emit_document(self, document: ast_tree.Document, parts: list[str]) -> None:
+        """
+        Convert a document node to Typst representation.
+
+        Args:
+            document (ast_tree.Document): The document node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("", "\n", document, parts)
 
     def convert_heading(self, heading: ast_tree.Heading) -> str:
         """
@@ -68,7 +73,23 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst heading markup.
         """
-        return self._add_markup(f"\n{'=' * heading.level} ", "\n", heading)
+        return self._render(self._emit_heading, heading)
+
+    def _emit_heading(self, heading: ast_tree.Heading, parts: list[str]) -> None:
+        """
+        Convert a heading node to Typst heading syntax.
+
+        Uses equal signs (=) to denote heading levels in Typst format.
+
+        Args:
+            heading (ast_tree.Heading): The heading node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        if 0 <= heading.level < len(self.heading_markers):
+            marker = self.heading_markers[heading.level]
+        else:
+            marker = f"\n{'=' * heading.level} "
+        self._emit_markup(marker, "\n", heading, parts)
 
     def convert_bold(self, bold: ast_tree.Bold) -> str:
         """
@@ -80,7 +101,17 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst bold markup using asterisks.
         """
-        return self._add_markup("*", "*", bold)
+        return self._render(self._emit_bold, bold)
+
+    def _emit_bold(self, bold: ast_tree.Bold, parts: list[str]) -> None:
+        """
+        Convert a bold text node to Typst bold syntax.
+
+        Args:
+            bold (ast_tree.Bold): The bold text node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("*", "*", bold, parts)
 
     def convert_italic(self, italic: ast_tree.Italic) -> str:
         """
@@ -92,7 +123,17 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst italic markup using underscores.
         """
-        return self._add_markup("_", "_", italic)
+        return self._render(self._emit_italic, italic)
+
+    def _emit_italic(self, italic: ast_tree.Italic, parts: list[str]) -> None:
+        """
+        Convert an italic text node to Typst italic syntax.
+
+        Args:
+            italic (ast_tree.Italic): The italic text node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("_", "_", italic, parts)
 
     def convert_strike(self, strike: ast_tree.Strike) -> str:
         """
@@ -104,7 +145,17 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst strikethrough markup using #strike function.
         """
-        return self._add_markup("#strike[", "]", strike)
+        return self._render(self._emit_strike, strike)
+
+    def _emit_strike(self, strike: ast_tree.Strike, parts: list[str]) -> None:
+        """
+        Convert a strikethrough text node to Typst strike syntax.
+
+        Args:
+            strike (ast_tree.Strike): The strikethrough text node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("#strike[", "]", strike, parts)
 
     def convert_text(self, text: ast_tree.Text) -> str:
         """
@@ -119,35 +170,30 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The escaped text suitable for Typst.
         """
-        result = text.text
-
-        typst_special_chars = [
-            "\\",
-            "*",
-            "#",
-            "[",
-            "]",
-            "+",
-            "-",
-            "/",
-            "$",
-            "=",
-            "<",
-            ">",
-            "@",
-            "'",
-            '"',
-            "`",
-        ]
+        return self._escape_text(text.text)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _escape_text(raw: str) -> str:
+        """
+        Escape raw text for Typst, caching the result per distinct string.
+
+        Short fragments such as words and punctuation repeat often across a
+        document, so cache hits skip the escaping passes entirely.
+
+        Args:
+            raw (str): The unescaped text.
+
+        Returns:
+            str: The escaped text suitable for Typst.
+        """
         unusual_escapes = {
             "_ ": "\\_ ",
             " _": " \\_",
         }
 
         # escape special chars
-        for char in typst_special_chars:
-            result = result.replace(char, f"\\{char}")
+        result = raw.translate(TypstConverter.special_chars_table)
 
         for char, escape_char in unusual_escapes.items():
             result = result.replace(char, escape_char)
@@ -164,7 +210,17 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst paragraph with newline separators.
         """
-        return self._add_markup("\n", "\n", paragraph)
+        return self._render(self._emit_paragraph, paragraph)
+
+    def _emit_paragraph(self, paragraph: ast_tree.Paragraph, parts: list[str]) -> None:
+        """
+        Convert a paragraph node to Typst representation.
+
+        Args:
+            paragraph (ast_tree.Paragraph): The paragraph node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("\n", "\n", paragraph, parts)
 
     def convert_line_break(self, line_break: ast_tree.LineBreak) -> str:
         """
@@ -188,7 +244,32 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst blockquote using #quote function.
         """
-        return self._add_markup("#quote[", "]", blockquote)
+        return self._render(self._emit_blockquote, blockquote)
+
+    def _emit_blockquote(
+        self, blockquote: ast_tree.Blockquote, parts: list[str]
+    ) -> None:
+        """
+        Convert a blockquote node to Typst quote syntax.
+
+        Args:
+            blockquote (ast_tree.Blockquote): The blockquote node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("#quote[", "]", blockquote, parts)
+
+    @staticmethod
+    def _add_indent(text: str, indent: str) -> str:
+        """Add indentation to multi-line text while preserving structure."""
+        has_trailing_newline = text.endswith("\n")
+        if has_trailing_newline:
+            text = text[:-1]
+
+        text = text.replace("\n", f"\n{indent}")
+
+        if has_trailing_newline:
+            text = text + "\n"
+        return text
 
     def convert_list(self, list_node: ast_tree.List) -> str:
         """
@@ -203,21 +284,21 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst list markup with proper formatting.
         """
+        return self._render(self._emit_list, list_node)
 
-        def add_indent(text: str, indent: str):
-            """Add indentation to multi-line text while preserving structure."""
-            has_trailing_newline = text.endswith("\n")
-            if has_trailing_newline:
-                text = text[:-1]
-
-            text = text.replace("\n", f"\n{indent}")
+    def _emit_list(self, list_node: ast_tree.List, parts: list[str]) -> None:
+        """
+        Convert a list node to Typst list syntax.
 
-            if has_trailing_newline:
-                text = text + "\n"
-            return text
+        Handles both ordered and unordered lists with proper indentation
+        and appropriate markers (-, +, or numbered).
 
+        Args:
+            list_node (ast_tree.List): The list node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
         indent = "\t"
-        result = "\n"
+        parts.append("\n")
 
         for child in list_node.children:
             if list_node.list_type == "unordered":
@@ -229,11 +310,9 @@ class TypstConverter(BaseConverter):
 
             child_content = child.convert(self)
 
-            child_content = add_indent(child_content, indent)
+            child_content = self._add_indent(child_content, indent)
 
-            result += f"{marker} {child_content}"
-
-        return result
+            parts.append(f"{marker} {child_content}")
 
     def convert_list_item(self, list_item: ast_tree.ListItem) -> str:
         """
@@ -245,12 +324,26 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst list item content with proper line ending.
         """
-        children_result = "".join([child.convert(self) for child in list_item.children])
+        return self._render(self._emit_list_item, list_item)
+
+    def _emit_list_item(self, list_item: ast_tree.ListItem, parts: list[str]) -> None:
+        """
+        Convert a list item node to Typst representation.
 
-        if not children_result.endswith("\n"):
-            children_result += "\n"
+        Args:
+            list_item (ast_tree.ListItem): The list item node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        start = len(parts)
+        for child in list_item.children:
+            self._emit(child, parts)
 
-        return children_result
+        # Children may emit empty strings, so check the last non-empty part
+        end = len(parts)
+        while end > start and not parts[end - 1]:
+            end -= 1
+        if end == start or not parts[end - 1].endswith("\n"):
+            parts.append("\n")
 
     def convert_task_list_item(self, task_list_item: ast_tree.TaskListItem) -> str:
         """
@@ -262,10 +355,22 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst task list item with checkbox marker.
         """
+        return self._render(self._emit_task_list_item, task_list_item)
+
+    def _emit_task_list_item(
+        self, task_list_item: ast_tree.TaskListItem, parts: list[str]
+    ) -> None:
+        """
+        Convert a task list item node to Typst checkbox syntax.
+
+        Args:
+            task_list_item (ast_tree.TaskListItem): The task list item node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
         if task_list_item.checked:
-            return self._add_markup("[x] ", "\n", task_list_item)
+            self._emit_markup("[x] ", "\n", task_list_item, parts)
         else:
-            return self._add_markup("[ ] ", "\n", task_list_item)
+            self._emit_markup("[ ] ", "\n", task_list_item, parts)
 
     def convert_code_block(self, code_block: ast_tree.CodeBlock) -> str:
         """
@@ -304,13 +409,21 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst image markup with optional alt text.
         """
-        result = f'#image("{image.source}"'
+        return self._render(self._emit_image, image)
 
-        if image.alt_text:
-            result += f', alt: "{image.alt_text}"'
-        result += ")"
+    def _emit_image(self, image: ast_tree.Image, parts: list[str]) -> None:
+        """
+        Convert an image node to Typst image syntax.
 
-        return result
+        Args:
+            image (ast_tree.Image): The image node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        parts.append(f'#image("{image.source}"')
+
+        if image.alt_text:
+            parts.append(f', alt: "{image.alt_text}"')
+        parts.append(")")
 
     def convert_link(self, link: ast_tree.Link) -> str:
         """
@@ -322,9 +435,19 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst link markup with optional link text.
         """
-        link_text = "".join([child.convert(self) for child in link.children])
+        return self._render(self._emit_link, link)
+
+    def _emit_link(self, link: ast_tree.Link, parts: list[str]) -> None:
+        """
+        Convert a link node to Typst link syntax.
 
-        return f'#link("{link.source}")' + (f"[{link_text}]" if link.children else "")
+        Args:
+            link (ast_tree.Link): The link node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        parts.append(f'#link("{link.source}")')
+        if link.children:
+            self._emit_markup("[", "]", link, parts)
 
     def convert_horizontal_rule(self, horizontal_rule: ast_tree.HorizontalRule) -> str:
         """
@@ -351,24 +474,39 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst table markup with proper column specification.
         """
-        columns = 0
-        for row in table.children:
-            columns = max(columns, len(row.children))
+        return self._render(self._emit_table, table)
 
-        result = f"\n#table(\n\tcolumns: {columns},\n"
+    def _emit_table(self, table: ast_tree.Table, parts: list[str]) -> None:
+        """
+        Convert a table node to Typst table syntax.
+
+        Calculates the maximum number of columns and generates a properly
+        formatted Typst table with headers and data rows.
+
+        Args:
+            table (ast_tree.Table): The table node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        columns = table.columns
+        parts.append(f"\n#table(\n\tcolumns: {columns},\n")
+
+        # Padding of empty cells, shared by rows missing the same number of cells
+        paddings = {}
 
         for row in table.children:
-            result += "\t"
-            result += row.convert(self)
+            parts.append("\t")
+            self._emit(row, parts)
 
             if not row.is_header:
-                result += "[], " * (columns - len(row.children))
+                missing = columns - len(row.children)
+                padding = paddings.get(missing)
+                if padding is None:
+                    padding = paddings[missing] = "[], " * missing
+                parts.append(padding)
 
-            result += "\n"
+            parts.append("\n")
 
-        result += ")\n"
-
-        return result
+        parts.append(")\n")
 
     def convert_table_row(self, table_row: ast_tree.TableRow) -> str:
         """
@@ -380,13 +518,26 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst table row markup, wrapped with table.header() if it's a header row.
         """
-        result = ""
+        return self._render(self._emit_table_row, table_row)
+
+    def _emit_table_row(self, table_row: ast_tree.TableRow, parts: list[str]) -> None:
+        """
+        Convert a table row node to Typst table row syntax.
+
+        Args:
+            table_row (ast_tree.TableRow): The table row node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        if table_row.is_header:
+            parts.append("table.header(")
+
         for cell in table_row.children:
-            result += f"[{cell.convert(self)}], "
+            parts.append("[")
+            self._emit(cell, parts)
+            parts.append("], ")
 
         if table_row.is_header:
-            result = f"table.header({result}),"
-        return result
+            parts.append("),")
 
     def convert_table_cell(self, table_cell: ast_tree.TableCell) -> str:
         """
@@ -398,5 +549,16 @@ class TypstConverter(BaseConverter):
         Returns:
             str: The Typst table cell content.
         """
-        cell_text = "".join([child.convert(self) for child in table_cell.children])
-        return cell_text
+        return self._render(self._emit_table_cell, table_cell)
+
+    def _emit_table_cell(
+        self, table_cell: ast_tree.TableCell, parts: list[str]
+    ) -> None:
+        """
+        Convert a table cell node to Typst representation.
+
+        Args:
+            table_cell (ast_tree.TableCell): The table cell node to convert.
+            parts (list[str]): Output fragments the result is appended to.
+        """
+        self._emit_markup("", "", table_cell, parts)
@@ -1,3 +1,6 @@
+from pathlib import Path
+from typing import TextIO
+
 from markup_document_converter.registry import get_parser, get_converter
 
 
@@ -21,9 +24,80 @@ def convert_document(content: str, source_format: str, target_format: str) -> st
         Exception: Propagates any parsing or conversion errors.
     """
 
+    return "".join(_convert_document_parts(content, source_format, target_format))
+
+
+def _convert_document_parts(
+    content: str, source_format: str, target_format: str
+) -> list[str]:
+    """
+    Convert the given document content into unjoined output fragments.
+
+    Args:
+        content (str): Source document content as a string.
+        source_format (str): Key identifying the input parser format.
+        target_format (str): Key identifying the output converter format.
+
+    Returns:
+        list[str]: Fragments of the rendered document, in order.
+    """
+
     parser = get_parser(source_format)
 
     ast_root = parser.to_AST(content)
 
     converter = get_converter(target_format)
-    return converter.convert_document(ast_root)
+    return converter.convert_document_parts(ast_root)
+
+
+def convert_document_to_stream(
+    content: str, source_format: str, target_format: str, out_fp: TextIO
+) -> None:
+    """
+    Convert the given document content and write the result to a text stream.
+
+    Produces the same output as `convert_document`, but writes the rendered
+    fragments to `out_fp` without joining them into one string first. Nothing
+    is written until the whole document has been converted.
+
+    Args:
+        content (str): Source document content as a string.
+        source_format (str): Key identifying the input parser format
+                             (e.g., 'markdown', 'rst').
+        target_format (str): Key identifying the output converter format
+                             (e.g., 'typst', 'latex').
+        out_fp (TextIO): Writable text stream receiving the output.
+
+    Raises:
+        ValueError: If no parser or converter is found for the given format keys.
+        Exception: Propagates any parsing or conversion errors.
+    """
+
+    out_fp.writelines(_convert_document_parts(content, source_format, target_format))
+
+
+def convert_document_to_file(
+    content: str, source_format: str, target_format: str, path: Path
+) -> None:
+    """
+    Convert the given document content and write the result to a file.
+
+    The file is only opened once the whole document has been converted, so a
+    failed conversion leaves an existing file untouched.
+
+    Args:
+        content (str): Source document content as a string.
+        source_format (str): Key identifying the input parser format
+                             (e.g., 'markdown', 'rst').
+        target_format (str): Key identifying the output converter format
+                             (e.g., 'typst', 'latex').
+        path (Path): Path of the UTF-8 output file, overwritten if it exists.
+
+    Raises:
+        ValueError: If no parser or converter is found for the given format keys.
+        Exception: Propagates any parsing, conversion or file errors.
+    """
+
+    parts = _convert_document_parts(content, source_format, target_format)
+    with path.open("w", encoding="utf-8") as out_fp:
+        out_fp.writelines(parts)
@@ -2,9 +2,8 @@ from markup_document_converter.parsers.base_parser import BaseParser
 from markup_document_converter.registry import register_parser
 import markup_document_converter.ast_tree as ast_tree
 import re
-from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Callable, List
+from typing import Callable, Iterable, Iterator, List, Optional
 
 
 class NodeType(Enum):
@@ -32,34 +31,45 @@ class NodeType(Enum):
     BLOCKQOUTE_GROUP = auto()
 
 
-def print_pre_node(node, indent=0):
-    pad = "  " * indent
-    print(f"{pad}- {node.node_type.name}: '{node.content.strip()}'")
-    for child in node.pre_children:
-        print_pre_node(child, indent + 1)
-
-
-def get_text_content(node):
-    """Recursively gets text content from a node."""
-    if node.node_type == NodeType.TEXT:
-        return node.content.strip()
-    return " ".join(get_text_content(child) for child in node.pre_children)
-
-
-@dataclass(order=True)
 class PreNode:
     """
     Represents a pre-processed node used for intermediate parsing before final AST conversion.
 
+    One is created per input line, so the class uses `__slots__` instead of a
+    per-instance `__dict__`.
+
     Attributes:
         content (str): The raw content of the node.
         node_type (NodeType): The type of this node.
         pre_children (list): A list of child PreNodes.
     """
 
-    node_type: NodeType
-    content: str = field(default_factory=str)
-    pre_children: list = field(default_factory=list)
+    __slots__ = ("node_type", "content", "pre_children")
+
+    def __init__(
+        self,
+        node_type: NodeType,
+        content: str = "",
+        pre_children: Optional[list] = None,
+    ):
+        self.node_type = node_type
+        self.content = content
+        self.pre_children = [] if pre_children is None else pre_children
+
+    def __repr__(self):
+        return (
+            f"PreNode(node_type={self.node_type!r}, content={self.content!r}, "
+            f"pre_children={self.pre_children!r})"
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.node_type, self.content, self.pre_children) == (
+            other.node_type,
+            other.content,
+            other.pre_children,
+        )
 
 
 def process_prenode(node_type: NodeType) -> Callable:
@@ -88,14 +98,14 @@ class MarkdownParser(BaseParser):
 
     def __init__(self) -> None:
         """
-        Initializes the MarkdownConverter. Compiles regex patterns and registers
-        node processing methods decorated with `@process_prenode`.
+        Initializes the MarkdownConverter. Compiles regex patterns and binds
+        node processing methods registered with `@process_prenode`.
         """
         super().__init__()
 
-        self.patterns: dict[NodeType, str] = {
+        patterns: dict[NodeType, str] = {
             NodeType.HEADING: r"^(#+)\s.*\n$",
-            NodeType.HORIZONTAL_RULE: r"^\s*([*\-_])(?:\s*\1){2,}\s*\n$",
+            NodeType.HORIZONTAL_RULE: r"^\s*(?P<rule_char>[*\-_])(?:\s*(?P=rule_char)){2,}\s*\n$",
             # TASK_LIST_ITEM must be checked first because this type is subset of other list items
             NodeType.TASK_LIST_ITEM: r"^\s*([-*+]|\d+\.)\s+\[( |x|X)\]\s+.*\n$",
             NodeType.UR_LIST_ITEM: r"^\s*[-*+]\s.*\n$",
@@ -103,12 +113,61 @@ class MarkdownParser(BaseParser):
             NodeType.LINE_BREAK: r"^\s*$",
             NodeType.BLOCKQOUTE: r"^\s*>+.*\n$",
             NodeType.CODE_BORDER: r"^\s*```.*\n$",
-            NodeType.TABLE_BORDER: r"^\|?(\s*:?\s*-+:?\s*\|)*\s*:?\s*-+:?\s*\|?\s*\n$",
-            NodeType.TABLE_ROW: r"^\|?(.*\|)+.*\|?\n$",
+            # Table patterns are written so that each line has a single way to
+            # match, avoiding exponential backtracking on lines with many pipes
+            NodeType.TABLE_BORDER: (
+                r"^\|?(?:\s*(?::\s*)?-+:?\s*\|)*\s*(?::\s*)?-+:?\s*(?:\|\s*)?\n$"
+            ),
+            NodeType.TABLE_ROW: r"^[^\n]*\|[^\n]*\n$",
             # Keep TEXT at the end so that is it default in case no pattern matches
             NodeType.TEXT: r".*",
         }
 
+        # First non-blank characters each line type can start with. TABLE_ROW and
+        # TEXT can start with anything and blank lines are always LINE_BREAK.
+        leading_chars: dict[NodeType, str] = {
+            NodeType.HEADING: "#",
+            NodeType.HORIZONTAL_RULE: "*-_",
+            NodeType.TASK_LIST_ITEM: "-*+0123456789",
+            NodeType.UR_LIST_ITEM: "-*+",
+            NodeType.OR_LIST_ITEM: "0123456789",
+            NodeType.BLOCKQOUTE: ">",
+            NodeType.CODE_BORDER: "`",
+            NodeType.TABLE_BORDER: "|:-",
+        }
+        fallback_types = [NodeType.TABLE_ROW, NodeType.TEXT]
+
+        def fuse_patterns(node_types: List[NodeType]) -> re.Pattern:
+            # Alternatives are tried in the order of `patterns` and the name of
+            # the outer group that matched identifies the node type
+            return re.compile(
+                "|".join(
+                    f"(?P<{node_type.name}>{patterns[node_type]})"
+                    for node_type in node_types
+                )
+            )
+
+        # A line is matched once, against the fused alternation of only those
+        # patterns that can start with its first non-blank character
+        self.line_patterns: dict[str, re.Pattern] = {
+            char: fuse_patterns(
+                [
+                    node_type
+                    for node_type in patterns
+                    if char in leading_chars.get(node_type, "")
+                ]
+                + fallback_types
+            )
+            for char in set("".join(leading_chars.values()))
+        }
+        self.default_line_pattern = fuse_patterns(fallback_types)
+        self.line_types: dict[str, NodeType] = {
+            node_type.name: node_type for node_type in patterns
+        }
+
+        # Leading part of a task list item up to its text, capturing the checkbox
+        self.task_marker_pattern = re.compile(r"\s*(?:[-*+]|\d+\.)\s+\[( |x|X)\]\s")
+
         self.inline_pattern = re.compile(
             r"(?P<code>`+)(?P<code_content>.+?)(?P=code)"
             r"|(?P<stars>\*{3,})(?P<stars_content>.+?)(?P=stars)"
@@ -120,12 +179,44 @@ class MarkdownParser(BaseParser):
             re.DOTALL,
         )
 
-        self.node_funcs: dict[NodeType, Callable[[PreNode], ast_tree.ASTNode]] = {}
+        # Every inline alternative starts with one of these characters
+        self.inline_start_chars = frozenset("`*~![")
+
+        # Inline alternatives whose content is parsed recursively, keyed by the
+        # group that closes last in them, which is what `match.lastgroup` reports
+        self.inline_nodes: dict[str, type[ast_tree.ASTNode]] = {
+            "tilde_content": ast_tree.Strike,
+            "stars_bold_content": ast_tree.Bold,
+            "stars_italic_content": ast_tree.Italic,
+        }
+
+        self.node_funcs: dict[NodeType, Callable[[PreNode], ast_tree.ASTNode]] = {
+            node_type: getattr(self, name)
+            for node_type, name in self._node_handler_names().items()
+        }
+
+    @classmethod
+    def _node_handler_names(cls) -> dict[NodeType, str]:
+        """
+        Collects the names of the methods registered with `@process_prenode`.
 
-        for attr_name in dir(self):
-            method = getattr(self, attr_name)
-            if callable(method) and hasattr(method, "_node_type"):
-                self.node_funcs[method._node_type] = method
+        The mapping is built once per class from the class dictionaries along
+        its MRO, so handlers registered by a subclass never affect its bases.
+
+        Returns:
+            dict[NodeType, str]: Name of the handler method for each node type.
+        """
+        handlers = cls.__dict__.get("_node_handlers")
+        if handlers is None:
+            handlers = {}
+            # Walk from the base classes down, so subclass handlers take precedence
+            for klass in reversed(cls.__mro__):
+                for name, attr in vars(klass).items():
+                    node_type = getattr(attr, "_node_type", None)
+                    if node_type is not None:
+                        handlers[node_type] = name
+            cls._node_handlers = handlers
+        return handlers
 
     def to_AST(self, content: str) -> ast_tree.ASTNode:
         """
@@ -141,50 +232,54 @@ class MarkdownParser(BaseParser):
         root = ast_tree.Document()
 
         pre_nodes = self.generate_prenodes(lines)
-        pre_nodes = self.group_pre_nodes(pre_nodes)
 
-        for node in pre_nodes:
+        for node in self.group_pre_nodes(pre_nodes):
             handler = self.node_funcs[node.node_type]
             ast_node = handler(node)
             root.add_child(ast_node)
 
         return root
 
-    def group_pre_nodes(self, pre_nodes: List[PreNode]) -> List[PreNode]:
+    def group_pre_nodes(self, pre_nodes: Iterable[PreNode]) -> Iterator[PreNode]:
         """
         Groups consecutive TEXT nodes into PARAGRAPH nodes and retains single-line node types.
 
+        The grouping stages are chained generators, only list grouping collects
+        its input because it has to see the whole sequence of list items.
+
         Args:
-            pre_nodes (List[PreNode]): Flat list of parsed PreNodes.
+            pre_nodes (Iterable[PreNode]): Flat sequence of parsed PreNodes.
 
         Returns:
-            List[PreNode]: Grouped PreNodes, ready for processing into AST nodes.
+            Iterator[PreNode]: Grouped PreNodes, ready for processing into AST nodes.
         """
 
-        def group_blockqoutes(pre_nodes: list[PreNode]):
+        def group_blockqoutes(pre_nodes: Iterable[PreNode]):
             """
             Groups nested blockquotes into hierarchical structures.
 
             Args:
-                nodes (list[PreNode]): Flat list of PreNodes.
+                nodes (Iterable[PreNode]): Flat sequence of PreNodes.
 
-            Returns:
-                list[PreNode]: Transformed list with nested blockquote structure.
+            Yields:
+                PreNode: Nodes with nested blockquote structure.
             """
 
-            def merger(
-                idx: int,
-                p_nodes: list[PreNode],
-                curr_indent: int,
-                root_blockqoute: PreNode,
-            ):
+            def merger(p_nodes: list[PreNode], root_blockqoute: PreNode) -> None:
+                # Enclosing blockquotes are kept on an explicit stack as
+                # (curr_indent, root_blockqoute) frames
+                stack = []
+                curr_indent = 1
+                idx = 0
                 while idx < len(p_nodes):
                     p_node = p_nodes[idx]
                     if p_node.node_type == NodeType.TEXT:
                         root_blockqoute.pre_children.append(p_node)
                         idx += 1
                     elif p_node.node_type == NodeType.BLOCKQOUTE:
-                        blockqoute_indent = len(re.findall(r">+", p_node.content)[0])
+                        # Blockquote lines start with `>` after leading whitespace
+                        markers = p_node.content.lstrip()
+                        blockqoute_indent = len(markers) - len(markers.lstrip(">"))
                         if blockqoute_indent == curr_indent:
                             p_node.node_type = NodeType.TEXT
                             root_blockqoute.pre_children.append(p_node)
@@ -192,12 +287,19 @@ class MarkdownParser(BaseParser):
                         elif blockqoute_indent > curr_indent:
                             new_blockqoute = PreNode(node_type=NodeType.BLOCKQOUTE)
                             root_blockqoute.pre_children.append(new_blockqoute)
-                            idx = merger(idx, p_nodes, curr_indent + 1, new_blockqoute)
+                            stack.append((curr_indent, root_blockqoute))
+                            curr_indent += 1
+                            root_blockqoute = new_blockqoute
+                        elif stack:
+                            curr_indent, root_blockqoute = stack.pop()
                         else:
-                            return idx
-                return idx
+                            return
+
+            def merge_group(grouping_node: PreNode) -> PreNode:
+                blockqoute = PreNode(node_type=NodeType.BLOCKQOUTE)
+                merger(grouping_node.pre_children, blockqoute)
+                return blockqoute
 
-            grouped = []
             grouping_node = None
 
             for p_node in pre_nodes:
@@ -210,50 +312,54 @@ class MarkdownParser(BaseParser):
                 elif (is_blockqoute or is_text) and grouping_node:
                     grouping_node.pre_children.append(p_node)
                 elif not (is_blockqoute or is_text) and grouping_node:
-                    grouped.append(grouping_node)
+                    yield merge_group(grouping_node)
                     grouping_node = None
-                    grouped.append(p_node)
+                    yield p_node
                 else:
-                    grouped.append(p_node)
+                    yield p_node
 
             if grouping_node:
-                grouped.append(grouping_node)
-
-            new_grouped = []
+                yield merge_group(grouping_node)
 
-            for p_node in grouped:
-                if p_node.node_type == NodeType.BLOCKQOUTE_GROUP:
-                    children = p_node.pre_children
-                    p_node = PreNode(node_type=NodeType.BLOCKQOUTE)
-                    merger(0, children, 1, p_node)
-                new_grouped.append(p_node)
-
-            return new_grouped
-
-        def group_lists(pre_nodes: list[PreNode]):
+        def group_lists(pre_nodes: Iterable[PreNode]):
             """
             Groups list items into list structures based on nesting level.
 
             Args:
-                nodes (list[PreNode]): Flat list of PreNodes.
+                nodes (Iterable[PreNode]): Flat sequence of PreNodes.
 
             Returns:
                 list[PreNode]: Transformed list with list structure.
             """
 
-            def merger(
-                idx: int, nesting_lvl: int, list_root: PreNode, p_nodes: list[PreNode]
-            ) -> int:
+            def merger(list_root: list[PreNode], p_nodes: list[PreNode]) -> None:
+                # Enclosing nesting levels are kept on an explicit stack as
+                # (nesting_lvl, list_root, list_node, list_type) frames. Only the
+                # grouping avoids recursion, process_list still recurses through
+                # the list item handlers once per nesting level.
+                stack = []
+                nesting_lvl = 0
                 list_node = None
                 list_type = None
-                bucket = None
+                # Items are revisited while nesting levels open and close, so
+                # their indentation is measured once up front
+                item_nestings = [
+                    (
+                        (
+                            len(p_node.pre_children[0].content)
+                            - len(p_node.pre_children[0].content.lstrip())
+                        )
+                        // 2
+                        if p_node.node_type in list_element_types
+                        else None
+                    )
+                    for p_node in p_nodes
+                ]
+                idx = 0
                 while idx < len(p_nodes):
                     p_node = p_nodes[idx]
                     if p_node.node_type in list_element_types:
-                        curr_nesting = (
-                            len(p_node.pre_children[0].content)
-                            - len(p_node.pre_children[0].content.lstrip())
-                        ) // 2
+                        curr_nesting = item_nestings[idx]
                         if curr_nesting == nesting_lvl:
                             if not list_type:
                                 list_type = p_node.node_type
@@ -272,20 +378,19 @@ class MarkdownParser(BaseParser):
                             idx += 1
                         elif curr_nesting > nesting_lvl:
                             if not list_node:
-                                bucket = PreNode(node_type=NodeType.UR_LIST_ITEM)
-                                list_root.pre_children.append(bucket)
-                                idx = merger(idx, nesting_lvl + 1, bucket, p_nodes)
+                                parent_item = PreNode(node_type=NodeType.UR_LIST_ITEM)
+                                list_root.pre_children.append(parent_item)
                             else:
-                                idx = merger(
-                                    idx,
-                                    nesting_lvl + 1,
-                                    list_node.pre_children[-1],
-                                    p_nodes,
-                                )
+                                parent_item = list_node.pre_children[-1]
+                            stack.append((nesting_lvl, list_root, list_node, list_type))
+                            nesting_lvl += 1
+                            list_root = parent_item
+                            list_node = None
+                            list_type = None
                         elif curr_nesting < nesting_lvl:
                             if list_node is not None:
                                 list_root.pre_children.append(list_node)
-                            return idx
+                            nesting_lvl, list_root, list_node, list_type = stack.pop()
                     else:
                         if list_node:
                             if nesting_lvl == 0:
@@ -293,21 +398,27 @@ class MarkdownParser(BaseParser):
                                 list_root.append(p_node)
                             else:
                                 list_root.pre_children.append(list_node)
-                                return idx
+                                nesting_lvl, list_root, list_node, list_type = (
+                                    stack.pop()
+                                )
+                                continue
                             list_type = None
                             list_node = None
                         else:
                             list_root.append(p_node)
 
                         idx += 1
-                if list_type:
-                    if nesting_lvl == 0:
-                        list_root.append(list_node)
-                    else:
-                        if list_node is not None:
+
+                # Close the lists that are still open, innermost first
+                while True:
+                    if list_type:
+                        if nesting_lvl == 0:
+                            list_root.append(list_node)
+                        elif list_node is not None:
                             list_root.pre_children.append(list_node)
-                    return idx
-                return idx
+                    if not stack:
+                        break
+                    nesting_lvl, list_root, list_node, list_type = stack.pop()
 
             list_element_types = [
                 NodeType.OR_LIST_ITEM,
@@ -342,96 +453,106 @@ class MarkdownParser(BaseParser):
                 grouped.append(grouping_node)
 
             new_grouped = []
-            merger(0, 0, new_grouped, grouped)
+            merger(new_grouped, grouped)
 
             return new_grouped
 
-        def group_code_blocks(pre_nodes: list[PreNode]):
+        def group_code_blocks(pre_nodes: Iterable[PreNode]):
             """
             Groups contents of code blocks into structures.
 
             Args:
-                nodes (list[PreNode]): Flat list of PreNodes.
+                nodes (Iterable[PreNode]): Flat sequence of PreNodes.
 
-            Returns:
-                list[PreNode]: Transformed list with code blocks structure.
+            Yields:
+                PreNode: Nodes with code blocks structure.
             """
-            grouped = []
             grouping_node = None
+            # Lines of the open code block, joined once the block is closed
+            code_lines = []
 
             for node in pre_nodes:
                 node_is_border = node.node_type == NodeType.CODE_BORDER
                 if node_is_border and not grouping_node:
+                    # The opening fence is kept apart from the code it encloses
                     grouping_node = PreNode(
-                        content=node.content, node_type=NodeType.CODE_BLOCK
+                        node_type=NodeType.CODE_BLOCK, pre_children=[node]
                     )
+                    code_lines = []
                 elif node_is_border and grouping_node:
-                    if node.content.lstrip().rstrip() == "```":
-                        grouped.append(grouping_node)
+                    if node.content.strip() == "```":
+                        grouping_node.content = "".join(code_lines)
+                        yield grouping_node
                         grouping_node = None
                     else:
-                        grouping_node.content += node.content
+                        code_lines.append(node.content)
                 elif not node_is_border and not grouping_node:
-                    grouped.append(node)
+                    yield node
                 else:
-                    grouping_node.content += node.content
+                    code_lines.append(node.content)
             if grouping_node:
-                grouped.append(grouping_node)
-
-            return grouped
+                grouping_node.content = "".join(code_lines)
+                yield grouping_node
 
-        def group_table_rows(pre_nodes: list[PreNode]):
+        def group_table_rows(pre_nodes: Iterable[PreNode]):
             """
             Groups contents of tables into structures.
 
             Args:
-                nodes (list[PreNode]): Flat list of PreNodes.
+                nodes (Iterable[PreNode]): Flat sequence of PreNodes.
 
-            Returns:
-                list[PreNode]: Transformed list with full tables structure.
+            Yields:
+                PreNode: Nodes with full tables structure.
             """
-            idx = 0
-            grouped = []
+
+            def close_group(grouping_node: PreNode) -> PreNode:
+                # Rows stay available as pre_children, the joined content is kept
+                # for stages that treat the table as raw text
+                grouping_node.content = "".join(
+                    p_node.content for p_node in grouping_node.pre_children
+                )
+                return grouping_node
+
             grouping_node = None
-            while idx < len(pre_nodes):
-                p_node = pre_nodes[idx]
+            pre_nodes = iter(pre_nodes)
+            next_node = next(pre_nodes, None)
+            while next_node is not None:
+                p_node = next_node
+                next_node = next(pre_nodes, None)
                 is_table_row = p_node.node_type == NodeType.TABLE_ROW
                 is_table_border = p_node.node_type == NodeType.TABLE_BORDER
                 if (is_table_row or is_table_border) and not grouping_node:
                     if (
-                        idx + 1 < len(pre_nodes)
-                        and pre_nodes[idx + 1].node_type == NodeType.TABLE_BORDER
+                        next_node is not None
+                        and next_node.node_type == NodeType.TABLE_BORDER
                     ):
                         grouping_node = PreNode(
-                            content=p_node.content, node_type=NodeType.TABLE
+                            node_type=NodeType.TABLE, pre_children=[p_node]
                         )
                     else:
                         p_node.node_type = NodeType.TEXT
-                        grouped.append(p_node)
+                        yield p_node
                 elif (is_table_row or is_table_border) and grouping_node:
-                    grouping_node.content += p_node.content
+                    grouping_node.pre_children.append(p_node)
                 elif grouping_node:
-                    grouped.append(grouping_node)
+                    yield close_group(grouping_node)
                     grouping_node = None
-                    grouped.append(p_node)
+                    yield p_node
                 elif not grouping_node:
-                    grouped.append(p_node)
-                idx += 1
+                    yield p_node
             if grouping_node:
-                grouped.append(grouping_node)
-            return grouped
+                yield close_group(grouping_node)
 
         def group_paragraphs(pre_nodes):
             """
             Groups rest of TEXT pre_nodes into paragraphs.
 
             Args:
-                nodes (list[PreNode]): Flat list of PreNodes.
+                nodes (Iterable[PreNode]): Flat sequence of PreNodes.
 
-            Returns:
-                list[PreNode]: Transformed list with paragraph structure.
+            Yields:
+                PreNode: Nodes with paragraph structure.
             """
-            grouped = []
             grouping_node = None
             for p_node in pre_nodes:
                 if p_node.node_type == NodeType.TEXT and not grouping_node:
@@ -441,13 +562,11 @@ class MarkdownParser(BaseParser):
                     grouping_node.pre_children.append(p_node)
                 else:
                     if grouping_node:
-                        grouped.append(grouping_node)
+                        yield grouping_node
                         grouping_node = None
-                    grouped.append(p_node)
+                    yield p_node
             if grouping_node:
-                grouped.append(grouping_node)
-
-            return grouped
+                yield grouping_node
 
         post_change_incorrect_table_rows = group_table_rows(pre_nodes)
         post_blockqoutes = group_blockqoutes(post_change_incorrect_table_rows)
@@ -456,23 +575,30 @@ class MarkdownParser(BaseParser):
         post_paragraphs = group_paragraphs(post_lists)
         return post_paragraphs
 
-    def generate_prenodes(self, lines: List[str]) -> List[PreNode]:
+    def generate_prenodes(self, lines: Iterable[str]) -> Iterator[PreNode]:
         """
         Converts lines of text into PreNodes using pattern matching.
 
         Args:
-            lines (List[str]): Lines from input file.
+            lines (Iterable[str]): Lines from input file.
 
-        Returns:
-            List[PreNode]: Generated PreNodes.
+        Yields:
+            PreNode: Generated PreNodes, one per line.
         """
-        pre_nodes = []
         for line in lines:
-            for node_type, pattern in self.patterns.items():
-                if re.match(pattern, line):
-                    pre_nodes.append(PreNode(content=line, node_type=node_type))
-                    break
-        return pre_nodes
+            stripped = line.lstrip()
+            if not stripped:
+                node_type = NodeType.LINE_BREAK
+            else:
+                pattern = self.line_patterns.get(stripped[0])
+                if pattern is None:
+                    # `\d` in the list item patterns also matches non-ASCII digits
+                    if stripped[0].isdecimal():
+                        pattern = self.line_patterns["0"]
+                    else:
+                        pattern = self.default_line_pattern
+                node_type = self.line_types[pattern.match(line).lastgroup]
+            yield PreNode(content=line, node_type=node_type)
 
     def build_inline_node(
         self, node_class: type[ast_tree.ASTNode], content: str
@@ -488,8 +614,7 @@ class MarkdownParser(BaseParser):
             ASTNode: Parsed inline node.
         """
         node = node_class()
-        for child in self.parse_inline(content):
-            node.add_child(child)
+        node.add_children(self.parse_inline(content))
         return node
 
     def parse_match(self, match: re.Match) -> ast_tree.ASTNode:
@@ -505,22 +630,16 @@ class MarkdownParser(BaseParser):
         Raises:
             ValueError: If the match doesn't match known inline formats.
         """
-        mapping = {
-            "code": ast_tree.InlineCode,
-            "tilde": ast_tree.Strike,
-            "stars_bold": ast_tree.Bold,
-            "stars_italic": ast_tree.Italic,
-        }
+        group_name = match.lastgroup
 
-        for group_name, node_class in mapping.items():
-            if match.group(group_name):
-                if group_name == "code":
-                    return node_class(code=match.group("code_content"))
-                return self.build_inline_node(
-                    node_class, match.group(f"{group_name}_content")
-                )
+        if group_name == "code_content":
+            return ast_tree.InlineCode(code=match.group("code_content"))
+
+        node_class = self.inline_nodes.get(group_name)
+        if node_class:
+            return self.build_inline_node(node_class, match.group(group_name))
 
-        if match.group("stars"):
+        if group_name == "stars_content":
             stars = match.group("stars")
             content = match.group("stars_content")
             if len(stars) % 2 == 0:
@@ -531,15 +650,14 @@ class MarkdownParser(BaseParser):
                 bold_node.add_child(italic_node)
                 return bold_node
 
-        if match.group("link_text") and match.group("link_url"):
+        if group_name == "link_url":
             text = match.group("link_text")
             url = match.group("link_url")
             link_node = ast_tree.Link(source=url)
-            for child in self.parse_inline(text):
-                link_node.add_child(child)
+            link_node.add_children(self.parse_inline(text))
             return link_node
 
-        if match.group("image_alt") and match.group("image_url"):
+        if group_name == "image_url" and match.group("image_alt"):
             alt = match.group("image_alt")
             src = match.group("image_url")
             return ast_tree.Image(source=src, alt_text=alt)
@@ -556,22 +674,29 @@ class MarkdownParser(BaseParser):
         Returns:
             List[ASTNode]: List of inline-parsed AST nodes.
         """
-        if not self.inline_pattern.search(text):
+        # Plain text is much cheaper to detect with a set check than a regex scan
+        if self.inline_start_chars.isdisjoint(text):
             return [ast_tree.Text(text)]
 
+        # Bound once, looked up for every match in the loop below
+        text_node = ast_tree.Text
+        parse_match = self.parse_match
         children = []
+        append = children.append
+
         pos = 0
-        while pos < len(text):
-            match = self.inline_pattern.search(text, pos)
-            if not match:
-                children.append(ast_tree.Text(text[pos:]))
-                break
+        for match in self.inline_pattern.finditer(text):
             start, end = match.span()
             if start > pos:
-                children.append(ast_tree.Text(text[pos:start]))
-            children.append(self.parse_match(match))
+                append(text_node(text[pos:start]))
+            append(parse_match(match))
             pos = end
 
+        if not children:
+            return [text_node(text)]
+        if pos < len(text):
+            append(text_node(text[pos:]))
+
         return children
 
     @process_prenode(NodeType.LINE_BREAK)
@@ -594,12 +719,11 @@ class MarkdownParser(BaseParser):
         Returns:
             ast_tree.Heading: A Heading AST node with parsed inline children.
         """
-        heading_level = len(re.findall(r"#+", node.content)[0])
+        heading_level = len(node.content) - len(node.content.lstrip("#"))
         node.content = node.content.lstrip("# ").rstrip("\n")
 
         heading = ast_tree.Heading(level=heading_level)
-        for child in self.parse_inline(node.content):
-            heading.add_child(child)
+        heading.add_children(self.parse_inline(node.content))
         return heading
 
     @process_prenode(NodeType.UR_LIST_ITEM)
@@ -618,8 +742,7 @@ class MarkdownParser(BaseParser):
         list_item = ast_tree.ListItem()
         for p_node in node.pre_children:
             if p_node.node_type == NodeType.TEXT:
-                for child in self.parse_inline(p_node.content):
-                    list_item.add_child(child)
+                list_item.add_children(self.parse_inline(p_node.content))
             else:
                 handler = self.node_funcs[p_node.node_type]
                 ast_node = handler(p_node)
@@ -635,21 +758,15 @@ class MarkdownParser(BaseParser):
         Returns:
             ast_tree.ListItem: A ListItem AST node of numeric order with parsed inline children.
         """
-        nesting_level = len(node.pre_children[0].content) - len(
-            node.pre_children[0].content.lstrip()
-        )
-        num_len = len(re.findall(r"\s*(\d*\.\s)", node.pre_children[0].content)[0])
-        match = re.match(r"^\s*(\d+)\.\s", node.pre_children[0].content)
-        if match:
-            order = match.group(1)
-        node.pre_children[0].content = node.pre_children[0].content[
-            nesting_level + num_len :
-        ]
+        content = node.pre_children[0].content
+        nesting_level = len(content) - len(content.lstrip())
+        dot_idx = content.index(".", nesting_level)
+        order = content[nesting_level:dot_idx]
+        node.pre_children[0].content = content[dot_idx + 2 :]
         list_item = ast_tree.ListItem(order=int(order))
         for p_node in node.pre_children:
             if p_node.node_type == NodeType.TEXT:
-                for child in self.parse_inline(p_node.content):
-                    list_item.add_child(child)
+                list_item.add_children(self.parse_inline(p_node.content))
             else:
                 handler = self.node_funcs[p_node.node_type]
                 ast_node = handler(p_node)
@@ -665,20 +782,14 @@ class MarkdownParser(BaseParser):
         Returns:
             ast_tree.TaskListItem: A TaskListItem AST node with parsed inline children.
         """
-        checked_sign = re.findall(r"\[( |x|X)\]", node.pre_children[0].content)[0]
-        checked_sign = not checked_sign.strip() == ""
-        sign_len = len(
-            re.findall(
-                r"(\s*([-*+]|\d+\.)\s+\[( |x|X)\]\s)", node.pre_children[0].content
-            )[0][0]
-        )
-        node.pre_children[0].content = node.pre_children[0].content[sign_len:]
+        match = self.task_marker_pattern.match(node.pre_children[0].content)
+        checked_sign = not match.group(1).strip() == ""
+        node.pre_children[0].content = node.pre_children[0].content[match.end() :]
 
         list_item = ast_tree.TaskListItem(checked=checked_sign)
         for p_node in node.pre_children:
             if p_node.node_type == NodeType.TEXT:
-                for child in self.parse_inline(p_node.content):
-                    list_item.add_child(child)
+                list_item.add_children(self.parse_inline(p_node.content))
             else:
                 handler = self.node_funcs[p_node.node_type]
                 ast_node = handler(p_node)
@@ -698,8 +809,7 @@ class MarkdownParser(BaseParser):
         """
         paragraph_node = ast_tree.Paragraph()
         for p_node in node.pre_children:
-            for inline_child in self.parse_inline(p_node.content):
-                paragraph_node.add_child(inline_child)
+            paragraph_node.add_children(self.parse_inline(p_node.content))
         return paragraph_node
 
     @process_prenode(NodeType.BLOCKQOUTE)
@@ -713,15 +823,21 @@ class MarkdownParser(BaseParser):
         Returns:
             ast_tree.Blockquote: A fully populated Blockquote AST node.
         """
-        blockqoute_node = ast_tree.Blockquote()
-        for child in node.pre_children:
-            if child.node_type == NodeType.BLOCKQOUTE:
-                blockqoute_node.add_child(self.process_blockqoute(child))
-            else:
-                child.content = child.content.lstrip(" >")
-                for inline_child in self.parse_inline(child.content):
-                    blockqoute_node.add_child(inline_child)
-        return blockqoute_node
+        root_blockqoute = ast_tree.Blockquote()
+        # Nested blockquotes are linked to their parent when first seen and
+        # filled later from this stack, so deep nesting does not recurse
+        stack = [(node, root_blockqoute)]
+        while stack:
+            pre_node, blockqoute_node = stack.pop()
+            for child in pre_node.pre_children:
+                if child.node_type == NodeType.BLOCKQOUTE:
+                    nested_blockqoute = ast_tree.Blockquote()
+                    blockqoute_node.add_child(nested_blockqoute)
+                    stack.append((child, nested_blockqoute))
+                else:
+                    child.content = child.content.lstrip(" >")
+                    blockqoute_node.add_children(self.parse_inline(child.content))
+        return root_blockqoute
 
     @process_prenode(NodeType.CODE_BLOCK)
     def process_code_block(self, node: PreNode) -> ast_tree.ASTNode:
@@ -733,10 +849,10 @@ class MarkdownParser(BaseParser):
         Returns:
             ast_tree.CodeBlock: A CodeBlock AST node.
         """
-        language = re.findall(r"```(.*)\n", node.content)[0]
-        first_line_len = len(re.findall(r".*\n", node.content)[0])
-        code = node.content[first_line_len:]
-        code_block_node = ast_tree.CodeBlock(code=code, language=language)
+        # The language follows the backticks of the opening fence up to its newline
+        fence = node.pre_children[0].content
+        language = fence[fence.index("```") + 3 : fence.index("\n")]
+        code_block_node = ast_tree.CodeBlock(code=node.content, language=language)
         return code_block_node
 
     @process_prenode(NodeType.TABLE)
@@ -749,18 +865,18 @@ class MarkdownParser(BaseParser):
         Returns:
             ast_tree.Table: A Table AST node.
         """
-        text = node.content.splitlines(keepends=True)
-        pre_nodes = self.generate_prenodes(text)
+        pre_nodes = node.pre_children
 
         alignments = []
         header = pre_nodes[0]
         border = pre_nodes[1]
         rows = pre_nodes[2:] if len(pre_nodes) > 2 else None
-        table_node = ast_tree.Table()
 
         border_cols = border.content.strip().split("|")
         cleaned = [s for s in border_cols if len(s) != 0]
         col_num = len(cleaned)
+        # Every row is checked to have exactly `col_num` cells
+        table_node = ast_tree.Table(columns=col_num)
         for cl in cleaned:
             cl = cl.strip()
             if cl[0] == ":" and cl[-1] == ":":
@@ -780,18 +896,26 @@ class MarkdownParser(BaseParser):
             table_node.add_child(row_node)
         return table_node
 
-    @process_prenode(NodeType.TABLE_ROW)
     def process_table_row(
         self, text: str, is_header: bool, correct_len: int, alignments: list[str]
     ) -> ast_tree.ASTNode:
         """
         Parses table row and returns TableRow AST node.
 
+        Called by `process_table` for each row; TABLE_ROW pre_nodes are never
+        dispatched on their own.
+
         Args:
-            node (PreNode): The Table Row pre_node.
+            text (str): The raw line of the row.
+            is_header (bool): Whether the row is the table header.
+            correct_len (int): Number of cells the row must have.
+            alignments (list[str]): Alignment of each column.
 
         Returns:
-            ast_tree.Table: A TableRow AST node.
+            ast_tree.TableRow: A TableRow AST node.
+
+        Raises:
+            ValueError: If the row does not have `correct_len` cells.
         """
         cols = text.strip().split("|")
         cleaned = [s for s in cols if len(s) != 0]
@@ -801,8 +925,7 @@ class MarkdownParser(BaseParser):
         for idx, cl in enumerate(cleaned):
             cl = cl.strip()
             cell_node = ast_tree.TableCell(alignment=alignments[idx])
-            for child in self.parse_inline(cl):
-                cell_node.add_child(child)
+            cell_node.add_children(self.parse_inline(cl))
             row_node.add_child(cell_node)
         return row_node
 
@@ -13,6 +13,11 @@ _parser_to_names: dict[type[BaseParser], list[str]] = {}
 _name_to_converter: dict[str, type[BaseConverter]] = {}
 _converter_to_names: dict[type[BaseConverter], list[str]] = {}
 
+# Parsers and converters keep no per-document state, so one instance of each
+# class is shared by all callers
+_parser_instances: dict[type[BaseParser], BaseParser] = {}
+_converter_instances: dict[type[BaseConverter], BaseConverter] = {}
+
 
 def register_parser(*names: str) -> Callable[[type[BaseParser]], type[BaseParser]]:
     """
@@ -58,25 +63,37 @@ def register_converter(
 
 def get_parser(name: str) -> BaseParser:
     """
-    Instantiate a parser by any of its registered names.
+    Return the shared parser instance for any of its registered names,
+    instantiating it on first use.
     """
     key = name.lower()
     try:
-        return _name_to_parser[key]()
+        cls = _name_to_parser[key]
     except KeyError:
         raise ValueError(f"No parser registered for '{name}'")
 
+    parser = _parser_instances.get(cls)
+    if parser is None:
+        parser = _parser_instances[cls] = cls()
+    return parser
+
 
 def get_converter(name: str) -> BaseConverter:
     """
-    Instantiate a converter by any of its registered names.
+    Return the shared converter instance for any of its registered names,
+    instantiating it on first use.
     """
     key = name.lower()
     try:
-        return _name_to_converter[key]()
+        cls = _name_to_converter[key]
     except KeyError:
         raise ValueError(f"No converter registered for '{name}'")
 
+    converter = _converter_instances.get(cls)
+    if converter is None:
+        converter = _converter_instances[cls] = cls()
+    return converter
+
 
 def get_available_parsers() -> list[tuple[str, list[str]]]:
     """
@@ -299,3 +299,27 @@ class TestLatexConverter:
         cell = ast.TableCell(children=[ast.Text("Cell text")])
         result = cell.convert(latex_converter)
         assert result == "Cell text"
+
+    def test_overridden_convert_method_is_used_for_nested_nodes(self):
+        class CustomConverter(LatexConverter):
+            def convert_bold(self, bold):
+                return "<B>"
+
+        paragraph = ast.Paragraph(
+            children=[
+                ast.Text("a "),
+                ast.Bold(children=[ast.Text("b")]),
+                ast.Text(" c"),
+            ]
+        )
+
+        result = paragraph.convert(CustomConverter())
+
+        assert result == "a <B> c\n\n"
+
+    def test_convert_method_matches_emitter_output(self, latex_converter):
+        bold = ast.Bold(children=[ast.Text("b")])
+        parts = []
+        latex_converter._emit_bold(bold, parts)
+
+        assert latex_converter.convert_bold(bold) == "".join(parts) == "\\textbf{b}"
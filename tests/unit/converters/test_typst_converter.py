@@ -635,3 +635,20 @@ class TestTypstConverter:
         result = cell.convert(self.typst_converter)
 
         assert result == "Cell text"
+
+    def test_overridden_convert_method_is_used_for_nested_nodes(self):
+        class CustomConverter(TypstConverter):
+            def convert_bold(self, bold):
+                return "<B>"
+
+        paragraph = ast_tree.Paragraph(
+            children=[
+                ast_tree.Text("a "),
+                ast_tree.Bold(children=[ast_tree.Text("b")]),
+                ast_tree.Text(" c"),
+            ]
+        )
+
+        result = paragraph.convert(CustomConverter())
+
+        assert result == "\na <B> c\n"
@@ -1,6 +1,8 @@
 import pytest
 from markup_document_converter.parsers.markdown_parser import (
     MarkdownParser,
+    NodeType,
+    process_prenode,
 )
 import markup_document_converter.ast_tree as ast_tree
 
@@ -81,6 +83,21 @@ def test_task_list(parser):
     assert extract_text(items[1]) == "checked\n"
 
 
+def test_nested_list(parser):
+    md = "- item1\n  - nested1\n  - nested2\n- item2\n"
+    doc = parser.to_AST(md)
+    lst = doc.children[0]
+    assert isinstance(lst, ast_tree.List)
+    items = lst.children
+    assert len(items) == 2
+    nested = items[0].children[-1]
+    assert isinstance(nested, ast_tree.List)
+    assert len(nested.children) == 2
+    assert extract_text(nested.children[0]) == "nested1\n"
+    assert extract_text(nested.children[1]) == "nested2\n"
+    assert extract_text(items[1]) == "item2\n"
+
+
 def test_horizontal_rule(parser):
     md = "---\n"
     doc = parser.to_AST(md)
@@ -141,6 +158,19 @@ def test_nested_blockqoutes(parser):
     assert extract_text(bq.children[1]) == "Nested quote\n"
 
 
+def test_deeply_nested_blockqoutes(parser):
+    # Deeper than the default recursion limit, so grouping and processing
+    # of nested blockquotes must not recurse per level
+    depth = 1500
+    doc = parser.to_AST(">" * depth + " Deep quote\n")
+    node = doc
+    for _ in range(depth):
+        assert len(node.children) == 1
+        node = node.children[0]
+        assert isinstance(node, ast_tree.Blockquote)
+    assert extract_text(node) == "Deep quote\n"
+
+
 def test_table(parser):
     md = "|H1|H2|\n|--|--|\n|a|b|\n"
     doc = parser.to_AST(md)
@@ -158,8 +188,30 @@ def test_table(parser):
     assert extract_text(cells[1]) == "b"
 
 
+def test_pipe_heavy_lines_without_newline(parser):
+    # lines like these used to make the table patterns backtrack exponentially
+    for md in ["a|" * 40, "|" + "  -  |" * 40]:
+        doc = parser.to_AST(md)
+        assert isinstance(doc.children[0], ast_tree.Paragraph)
+        assert extract_text(doc) == md
+
+
 def test_empty_content(parser):
     # edge case: empty string produces empty Document
     doc = parser.to_AST("")
     assert isinstance(doc, ast_tree.Document)
     assert doc.children == []
+
+
+def test_subclass_handler_does_not_affect_base_parser():
+    class CustomParser(MarkdownParser):
+        @process_prenode(NodeType.HEADING)
+        def custom_heading(self, node):
+            return ast_tree.Text("custom")
+
+    custom_doc = CustomParser().to_AST("# Title\n")
+    assert custom_doc.children[0].text == "custom"
+
+    doc = MarkdownParser().to_AST("# Title\n")
+    assert isinstance(doc.children[0], ast_tree.Heading)
+    assert extract_text(doc.children[0]) == "Title"
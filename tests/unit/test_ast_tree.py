@@ -45,6 +45,13 @@ class TestASTNode:
         node.add_child(child)
         assert node.children == [child]
 
+    def test_add_children(self):
+        node = ASTNode("parent")
+        first, second = ASTNode("first"), ASTNode("second")
+        node.add_child(first)
+        node.add_children(iter([second]))
+        assert node.children == [first, second]
+
     def test_set_attribute(self):
         node = ASTNode("test")
         node.set_attribute("key", "value")
@@ -352,6 +359,14 @@ class TestTable:
         table = Table([header, row])
         assert table.children == [header, row]
 
+    def test_columns(self):
+        row = TableRow(
+            False, [TableCell(None, [Text("A")]), TableCell(None, [Text("B")])]
+        )
+        assert Table().columns == 0
+        assert Table([row]).columns == 2
+        assert Table([row], columns=3).columns == 3
+
 
 class TestTableRow:
     def test_init(self):
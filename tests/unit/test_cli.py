@@ -135,6 +135,37 @@ class TestCLICommands:
         assert result.exit_code != 0
         assert "Cannot save file to a non-existent directory" in result.stdout
 
+    def test_failed_conversion_keeps_existing_output(self, runner, tmp_path):
+        input_file = tmp_path / "test.md"
+        input_file.write_text("| a | b |\n|---|---|\n| 1 | 2 | 3 |\n")
+        output_file = tmp_path / "out.typ"
+        output_file.write_text("previous output")
+        result = runner.invoke(
+            app,
+            ["convert", str(input_file), "--to", "typst", "--output", str(output_file)],
+        )
+        assert result.exit_code == 1
+        assert "Number of cells in row is incorrect" in result.stdout
+        assert output_file.read_text() == "previous output"
+
+    def test_unknown_target_format_creates_no_output(self, runner, tmp_path):
+        input_file = tmp_path / "test.md"
+        input_file.write_text("# Test\n")
+        output_file = tmp_path / "new.out"
+        result = runner.invoke(
+            app,
+            [
+                "convert",
+                str(input_file),
+                "--to",
+                "nosuchformat",
+                "-o",
+                str(output_file),
+            ],
+        )
+        assert result.exit_code == 1
+        assert not output_file.exists()
+
     def test_webapp_help(self, runner):
         result = runner.invoke(app, ["webapp", "--help"])
         assert result.exit_code == 0
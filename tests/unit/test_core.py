@@ -1,5 +1,7 @@
+import io
+
 import pytest
-from markup_document_converter.core import convert_document
+from markup_document_converter.core import convert_document, convert_document_to_stream
 
 
 class TestConvertDocument:
@@ -80,3 +82,26 @@ class TestConvertDocument:
         assert "\\href{https://example.com}{Link text}" in result
         assert "\\includegraphics" in result
         assert "\\caption{Alt text}" in result
+
+
+class TestConvertDocumentToStream:
+    @pytest.mark.parametrize("target_format", ["latex", "typst"])
+    def test_matches_convert_document(self, target_format):
+        content = (
+            "# Test\n\n"
+            "*Italic* and **bold** text with `code`.\n\n"
+            "- item\n"
+            "- [x] done\n\n"
+            "| A | B |\n"
+            "|---|---|\n"
+            "| 1 | 2 |\n"
+        )
+        out_fp = io.StringIO()
+        convert_document_to_stream(content, "md", target_format, out_fp)
+        assert out_fp.getvalue() == convert_document(content, "md", target_format)
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError):
+            convert_document_to_stream(
+                "# Test\n", "md", "invalid_format", io.StringIO()
+            )
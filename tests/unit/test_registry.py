@@ -0,0 +1,37 @@
+import pytest
+from markup_document_converter.registry import get_converter, get_parser
+from markup_document_converter.converters.latex_converter import LatexConverter
+from markup_document_converter.converters.typst_converter import TypstConverter
+from markup_document_converter.parsers.markdown_parser import MarkdownParser
+
+
+class TestGetConverter:
+    def test_returns_shared_instance(self):
+        converter = get_converter("typst")
+        assert isinstance(converter, TypstConverter)
+        assert get_converter("typst") is converter
+
+    def test_names_are_case_insensitive(self):
+        assert get_converter("TYPST") is get_converter("typst")
+
+    def test_instances_are_per_class(self):
+        assert isinstance(get_converter("latex"), LatexConverter)
+        assert get_converter("latex") is not get_converter("typst")
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError):
+            get_converter("nosuchformat")
+
+
+class TestGetParser:
+    def test_returns_shared_instance(self):
+        parser = get_parser("markdown")
+        assert isinstance(parser, MarkdownParser)
+        assert get_parser("markdown") is parser
+
+    def test_aliases_share_instance(self):
+        assert get_parser("md") is get_parser("markdown")
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError):
+            get_parser("nosuchformat")